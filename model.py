@@ -1,8 +1,171 @@
-import pandas as pd
-from sklearn.linear_model import LinearRegression
-from sklearn.model_selection import train_test_split
-from sklearn.metrics import r2_score
-from datetime import datetime
+import atexit
+import glob
+import hashlib
+import json
+import math
+import mmap
+import os
+import pickle
+import sys
+import tempfile
+import time
+import weakref
+from functools import lru_cache
+
+import numpy as np
+
+# pandas, scipy and numba (via model_kernel) are imported where they are
+# first needed, so showing the menu or the prediction history stays fast.
+
+# Part of the model cache key; bump it whenever the fitting procedure changes
+# so pickled fits from older versions are not reused.
+_MODEL_CACHE_VERSION = 2
+
+# Below this many rows the JIT dispatch costs more than NumPy's dot product.
+_JIT_MIN_ROWS = 256
+
+
+# Models holding an open data.txt handle.  Weak references, so the exit hook
+# does not keep every model (and its cached frames) alive until shutdown.
+_open_models = weakref.WeakSet()
+
+
+@atexit.register
+def _close_open_models():
+    """Flush and close the data.txt handles of models still alive at exit."""
+    for model in list(_open_models):
+        model._close()
+
+
+def _parquet_path(csv_path):
+    """Path of the Parquet cache that sits next to the CSV file."""
+    return os.path.splitext(csv_path)[0] + '.parquet'
+
+
+@lru_cache(maxsize=4)
+def _read_csv_cached(csv_path, mtime):
+    """Parse the dataset once per ``(csv_path, mtime)`` per process.
+
+    The CSV is parsed by the multithreaded PyArrow engine into Arrow-backed
+    columns when pyarrow is installed, and converted once to a sibling
+    Parquet file, which is read instead while it is newer than the CSV.
+    The returned frame is shared between callers and must not be modified
+    in place.
+    """
+    import pandas as pd
+
+    parquet_path = _parquet_path(csv_path)
+    if os.path.exists(parquet_path) and os.path.getmtime(parquet_path) >= mtime:
+        try:
+            return pd.read_parquet(parquet_path, dtype_backend='pyarrow')
+        except Exception:
+            pass  # unreadable cache — reparse the CSV and rebuild it below
+    try:
+        df = pd.read_csv(csv_path, engine='pyarrow', dtype_backend='pyarrow')
+    except ImportError:
+        df = pd.read_csv(csv_path)
+    _write_parquet_cache(df, parquet_path)
+    return df
+
+
+def _write_parquet_cache(df, parquet_path):
+    """Write ``df`` to ``parquet_path`` atomically, ignoring failures.
+
+    The frame is written to a temporary file in the same directory and then
+    renamed into place, so an interrupted or failed write never leaves a
+    truncated cache behind.
+    """
+    tmp_path = None
+    try:
+        fd, tmp_path = tempfile.mkstemp(
+            suffix='.parquet.tmp', dir=os.path.dirname(parquet_path) or '.')
+        os.close(fd)
+        df.to_parquet(tmp_path, engine='pyarrow', compression='snappy')
+        os.replace(tmp_path, parquet_path)
+        tmp_path = None
+    except (ImportError, OSError):
+        pass  # pyarrow missing, disk full or directory read-only — keep the CSV
+    finally:
+        if tmp_path is not None:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+
+def _count_csv_rows(csv_path):
+    """Count data rows in a CSV by counting newlines in 1 MiB blocks."""
+    n_newlines = 0
+    last = b'\n'
+    with open(csv_path, 'rb') as f:
+        for buf in iter(lambda: f.read(1 << 20), b''):
+            n_newlines += buf.count(b'\n')
+            last = buf[-1:]
+    # A final line without a trailing newline still counts; the header does not.
+    return max(n_newlines + (last != b'\n') - 1, 0)
+
+
+def _tail_lines(path, last):
+    """Return ``(lines, truncated)`` for the last ``last`` lines of ``path``.
+
+    ``lines`` is oldest first and ``truncated`` is True when earlier lines
+    were left out.  The file is memory-mapped and scanned backwards from the end, so the
+    cost depends on ``last`` rather than on the size of the file.
+    """
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return [], False
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            end = mm.size()
+            if mm[end - 1:end] == b'\n':
+                end -= 1
+            lines = []
+            while end > 0 and len(lines) < last:
+                start = mm.rfind(b'\n', 0, end) + 1
+                lines.append(mm[start:end].decode('utf-8', errors='replace').strip())
+                end = start - 1
+    lines.reverse()
+    return lines, end > 0
+
+
+def _format_record(line):
+    """Render one data.txt line for display, whether JSON or legacy text.
+
+    Lines that do not parse as a complete record are returned unchanged.
+    """
+    if not line.startswith('{'):
+        return line
+    try:
+        record = json.loads(line)
+        features = ", ".join(f"{k}={v}" for k, v in record['features'].items())
+        return f"{record['ts']} | {features} | Predicted: ${record['price']:,.2f}"
+    except (ValueError, KeyError, TypeError, AttributeError):
+        return line  # truncated or corrupt record — show it as written
+
+
+class _NormalEqRegressor:
+    """Fitted linear model exposing ``coef_``, ``intercept_`` and ``predict``."""
+
+    def __init__(self, coef, intercept):
+        self.coef_ = coef
+        self.intercept_ = intercept
+
+    def predict(self, X):
+        return np.asarray(X, dtype=np.float64) @ self.coef_ + self.intercept_
+
+
+def _solve_normal_eq(G, c):
+    """Solve the normal equations ``G @ coef = c`` for a Gram matrix ``G``.
+
+    Uses a Cholesky factorisation; a singular ``G`` (e.g. a constant column)
+    falls back to ``lstsq``.
+    """
+    from scipy.linalg import LinAlgError, cho_factor, cho_solve
+
+    try:
+        return cho_solve(cho_factor(G), c)
+    except LinAlgError:
+        return np.linalg.lstsq(G, c, rcond=None)[0]
 
 
 class HousePriceModel:
@@ -17,35 +180,75 @@ class HousePriceModel:
         self.csv_path = csv_path
         self.data_file = data_file
         self.df = None
+        self._df_mtime = None
+        self._numeric_cols_cache = None
+        self._numeric_cols_df_id = None
+        self._X_np = None
+        self._y_np = None
+        self._Xy_key = None
+        self._numeric_idx = None
+        self._G_full = None
+        self._c_full = None
+        self._x_mean = None
+        self._y_mean = None
+        self._X_test = None
+        self._y_test = None
+        self._gram_key = None
         self.model = None
+        self._coef = None
+        self._intercept = None
         self.features = list(self.DEFAULT_FEATURES)
         self.r2 = None
+        self._r2_in_sample = False
         self.is_trained = False
+        self._data_fh = None
+        self._save_tpl = None
+        self._save_tpl_key = None
+        self._build_save_template()
+        self._ts_sec = None
+        self._ts_str = None
 
     # ------------------------------------------------------------------ #
     #  Dataset operations
     # ------------------------------------------------------------------ #
     def load_dataset(self):
-        """Load the KC House dataset from CSV."""
-        self.df = pd.read_csv(self.csv_path)
+        """Load every column of the KC House dataset."""
+        return self._load_full()
+
+    def _load_full(self):
+        """Load all columns through the shared, mtime-keyed dataset cache."""
+        self._df_mtime = os.path.getmtime(self.csv_path)
+        self.df = _read_csv_cached(self.csv_path, self._df_mtime)
+        self._numeric_cols_cache = None
+        self._numeric_cols_df_id = None
+        self._G_full = None
         return self.df
 
     def display_dataset_info(self):
-        """Print basic information about the loaded dataset."""
-        if self.df is None:
-            self.load_dataset()
+        """Print basic information about the dataset.
+
+        Unless the dataset is already loaded, only the first five rows are
+        parsed and the row count comes from counting newlines in the CSV.
+        """
+        if self.df is not None:
+            n_rows = self.df.shape[0]
+            head = self.df.head()
+        else:
+            import pandas as pd
+            n_rows = _count_csv_rows(self.csv_path)
+            head = pd.read_csv(self.csv_path, nrows=5)
         print("\n" + "=" * 60)
         print("            KC HOUSE DATASET INFORMATION")
         print("=" * 60)
-        print(f"  Rows    : {self.df.shape[0]}")
-        print(f"  Columns : {self.df.shape[1]}")
+        print(f"  Rows    : {n_rows}")
+        print(f"  Columns : {head.shape[1]}")
         print("-" * 60)
         print("  Column Names:")
-        for i, col in enumerate(self.df.columns, 1):
+        for i, col in enumerate(head.columns, 1):
             print(f"    {i:>2}. {col}")
         print("-" * 60)
         print("  First 5 rows:")
-        print(self.df.head().to_string(index=False))
+        print(head.to_string(index=False))
         print("=" * 60)
 
     # ------------------------------------------------------------------ #
@@ -54,9 +257,16 @@ class HousePriceModel:
     def get_numeric_columns(self):
         """Return numeric columns excluding 'id', 'date', and 'price'."""
         if self.df is None:
-            self.load_dataset()
+            self._load_full()
+        if id(self.df) == self._numeric_cols_df_id:
+            return list(self._numeric_cols_cache)
+
         exclude = {'id', 'date', 'price'}
-        return [c for c in self.df.select_dtypes(include='number').columns if c not in exclude]
+        self._numeric_cols_cache = [
+            c for c in self.df.select_dtypes(include='number').columns if c not in exclude
+        ]
+        self._numeric_cols_df_id = id(self.df)
+        return list(self._numeric_cols_cache)
 
     def select_features(self):
         """Interactive feature selection — user picks from available numeric columns."""
@@ -91,29 +301,191 @@ class HousePriceModel:
                 print("  Invalid input — using default features.")
                 self.features = list(self.DEFAULT_FEATURES)
 
+        self._build_save_template()
         self.is_trained = False
         print("=" * 60)
 
     # ------------------------------------------------------------------ #
     #  Training
     # ------------------------------------------------------------------ #
+    def _training_arrays(self):
+        """Return ``(X, y)`` over every numeric column, cached per loaded frame.
+
+        ``X`` is a C-contiguous float64 block ordered like
+        ``get_numeric_columns()``, kept in float64 so the Gram matrix is
+        built from it without another cast.
+        """
+        columns = self.get_numeric_columns()
+        if id(self.df) != self._Xy_key:
+            self._X_np = np.ascontiguousarray(
+                self.df[columns].to_numpy(dtype=np.float64))
+            self._y_np = self.df['price'].to_numpy(dtype=np.float64)
+            self._numeric_idx = {c: i for i, c in enumerate(columns)}
+            self._Xy_key = id(self.df)
+            self._G_full = None
+        return self._X_np, self._y_np
+
+    def _prepare_gram(self, test_size, random_state):
+        """Split the data and precompute the centred Gram matrix of the train rows.
+
+        The Gram matrix ``G = Xc.T @ Xc`` and ``c = Xc.T @ yc`` cover every
+        numeric column, so any feature subset is fitted by indexing a p x p
+        block instead of touching the rows again.  Recomputed only when the
+        dataset is reloaded or the split parameters change.
+        """
+        X, y = self._training_arrays()
+        key = (self._Xy_key, test_size, random_state)
+        if self._G_full is not None and self._gram_key == key:
+            return
+
+        # Shuffle once into a contiguous copy, then split with plain slices.
+        rng = np.random.default_rng(random_state)
+        perm = rng.permutation(X.shape[0])
+        cut = int(X.shape[0] * (1 - test_size))
+        Xs = X[perm]
+        ys = y[perm]
+        X_train, self._X_test = Xs[:cut], Xs[cut:]
+        y_train, self._y_test = ys[:cut], ys[cut:]
+
+        self._x_mean = X_train.mean(axis=0)
+        self._y_mean = y_train.mean()
+        Xc = X_train - self._x_mean
+        self._G_full = Xc.T @ Xc
+        self._c_full = Xc.T @ (y_train - self._y_mean)
+        self._gram_key = key
+
+    def _model_cache_path(self, mtime, test_size, random_state):
+        """Path of the pickled fit for the current features and CSV version.
+
+        The name is ``.model_cache_<csv>_<version>_<fit>.pkl``: one digest of
+        the CSV path, one of the cache version and CSV mtime, and one of the
+        features and split parameters.
+        """
+        def digest(raw):
+            return hashlib.blake2b(raw.encode(), digest_size=6).hexdigest()
+
+        csv_key = digest(os.path.abspath(self.csv_path))
+        version_key = digest(f"{_MODEL_CACHE_VERSION}|{mtime}")
+        fit_key = digest(f"{self.features}|{test_size}|{random_state}")
+        name = f".model_cache_{csv_key}_{version_key}_{fit_key}.pkl"
+        return os.path.join(os.path.dirname(self.csv_path), name)
+
+    @staticmethod
+    def _prune_model_cache(cache_path):
+        """Delete cached fits for the same CSV made from another CSV version."""
+        directory, name = os.path.split(cache_path)
+        csv_prefix, version_key, _ = name.rsplit('_', 2)
+        for stale in glob.glob(os.path.join(glob.escape(directory or '.'),
+                                            csv_prefix + '_*.pkl')):
+            if os.path.basename(stale).rsplit('_', 2)[1] != version_key:
+                try:
+                    os.remove(stale)
+                except OSError:
+                    pass
+
     def train_model(self, test_size=0.2, random_state=42):
-        """Train Linear Regression and compute R-squared score."""
-        if self.df is None:
-            self.load_dataset()
+        """Train Linear Regression and compute R-squared score.
 
-        X = self.df[self.features]
-        y = self.df['price']
+        Fits are pickled next to the CSV, keyed by the feature list, the CSV
+        mtime and the split parameters, so retraining an unchanged setup
+        just reloads the previous result.
+        """
+        mtime = os.path.getmtime(self.csv_path)
+        cache_path = self._model_cache_path(mtime, test_size, random_state)
+        try:
+            with open(cache_path, 'rb') as f:
+                self.model, self.r2 = pickle.load(f)
+        except Exception:
+            pass  # missing, stale or foreign pickle — just refit
+        else:
+            self._coef = self.model.coef_
+            self._intercept = self.model.intercept_
+            self._r2_in_sample = False
+            self.is_trained = True
+            self.display_r_squared()
+            return
 
-        X_train, X_test, y_train, y_test = train_test_split(
-            X, y, test_size=test_size, random_state=random_state
-        )
+        # Refit on the CSV as it is now, not a frame loaded before an edit.
+        if self.df is not None and self._df_mtime != mtime:
+            self._load_full()
+        self._prepare_gram(test_size, random_state)
+        idx = [self._numeric_idx[f] for f in self.features]
+        coef = _solve_normal_eq(self._G_full[np.ix_(idx, idx)], self._c_full[idx])
+        intercept = self._y_mean - self._x_mean[idx] @ coef
 
-        self.model = LinearRegression()
-        self.model.fit(X_train, y_train)
+        self.model = _NormalEqRegressor(coef, intercept)
+        self._coef = self.model.coef_
+        self._intercept = self.model.intercept_
 
+        X_test = self._X_test[:, idx]
+        y_test = self._y_test
         y_pred = self.model.predict(X_test)
-        self.r2 = r2_score(y_test, y_pred)
+        resid = y_test - y_pred
+        ss_res = float(resid @ resid)
+        ss_tot = float(((y_test - y_test.mean()) ** 2).sum())
+        self.r2 = 1.0 - ss_res / ss_tot
+        self._r2_in_sample = False
+        self.is_trained = True
+
+        # Key the pickle by the version of the CSV the frame was loaded from.
+        cache_path = self._model_cache_path(self._df_mtime, test_size, random_state)
+        try:
+            with open(cache_path, 'wb') as f:
+                pickle.dump((self.model, self.r2), f)
+            self._prune_model_cache(cache_path)
+        except OSError:
+            pass  # caching is best effort; a read-only directory just refits
+
+        self.display_r_squared()
+
+    def train_model_streaming(self, chunksize=256_000):
+        """Fit on the whole CSV in chunks without loading it into memory.
+
+        Each chunk adds its contribution to the Gram matrix ``Z.T @ Z`` and to
+        ``Z.T @ y``, where ``Z`` is the feature block plus an intercept column,
+        so memory stays O(chunksize * p) and the final solve matches a
+        single-pass least-squares fit.  Values are shifted by the first
+        chunk's means to keep the Gram matrix well conditioned.  There is no
+        held-out split; the reported R-squared is in-sample.
+        """
+        import pandas as pd
+
+        p = len(self.features)
+        dtypes = dict.fromkeys(self.features + ['price'], np.float64)
+        G = np.zeros((p + 1, p + 1))
+        Zy = np.zeros(p + 1)
+        yy = 0.0
+        x_shift = y_shift = None
+
+        for chunk in pd.read_csv(self.csv_path, usecols=self.features + ['price'],
+                                 dtype=dtypes, chunksize=chunksize):
+            if chunk.empty:
+                continue
+            X = chunk[self.features].to_numpy(np.float64)
+            y = chunk['price'].to_numpy()
+            if x_shift is None:
+                x_shift = X.mean(axis=0)
+                y_shift = y.mean()
+            Z = np.hstack([X - x_shift, np.ones((len(chunk), 1))])
+            yc = y - y_shift
+            G += Z.T @ Z
+            Zy += Z.T @ yc
+            yy += float(yc @ yc)
+
+        if x_shift is None:
+            raise ValueError(f"{self.csv_path} has no data rows to train on")
+
+        w = _solve_normal_eq(G, Zy)
+        coef = w[:p]
+        self.model = _NormalEqRegressor(coef, w[p] + y_shift - x_shift @ coef)
+        self._coef = self.model.coef_
+        self._intercept = self.model.intercept_
+
+        n = G[p, p]
+        ss_res = yy - float(w @ Zy)
+        ss_tot = yy - Zy[p] ** 2 / n
+        self.r2 = 1.0 - ss_res / ss_tot
+        self._r2_in_sample = True
         self.is_trained = True
 
         self.display_r_squared()
@@ -124,7 +496,10 @@ class HousePriceModel:
         print("           MODEL EVALUATION")
         print("=" * 60)
         print(f"  Features used : {self.features}")
-        print(f"  R-squared     : {self.r2:.4f}")
+        if self._r2_in_sample:
+            print(f"  R-squared     : {self.r2:.4f} (in-sample, no held-out split)")
+        else:
+            print(f"  R-squared     : {self.r2:.4f}")
         print("=" * 60)
 
     # ------------------------------------------------------------------ #
@@ -139,20 +514,33 @@ class HousePriceModel:
         print("\n" + "=" * 60)
         print("           PREDICT HOUSE PRICE")
         print("=" * 60)
-        print("  Enter values for each feature:\n")
+        print("  Enter all values on one line, separated by commas, in this order:")
+        print(f"    {', '.join(self.features)}")
+        print("  (or press Enter to be prompted for each feature)")
 
-        values = {}
-        for feat in self.features:
-            while True:
-                try:
-                    val = float(input(f"    {feat}: "))
-                    values[feat] = val
-                    break
-                except ValueError:
-                    print("    Please enter a valid number.")
+        line = input("  >> ").strip()
+        x = self._parse_feature_line(line)
+        if x is not None:
+            values = dict(zip(self.features, x.tolist()))
+        else:
+            if line:
+                print(f"  Expected {len(self.features)} numbers — prompting per feature.")
+            print("  Enter values for each feature:\n")
+            values = {}
+            for feat in self.features:
+                while True:
+                    try:
+                        val = float(input(f"    {feat}: "))
+                        if not math.isfinite(val):
+                            raise ValueError(val)
+                        values[feat] = val
+                        break
+                    except ValueError:
+                        print("    Please enter a valid number.")
+            x = np.fromiter((values[f] for f in self.features),
+                            dtype=np.float64, count=len(self.features))
 
-        input_df = pd.DataFrame([values])
-        predicted = self.model.predict(input_df)[0]
+        predicted = float(self.predict_batch(x[np.newaxis, :])[0])
 
         print("-" * 60)
         print(f"  Predicted House Price: ${predicted:,.2f}")
@@ -161,31 +549,136 @@ class HousePriceModel:
         self.save_prediction(values, predicted)
         return predicted
 
+    def _parse_feature_line(self, line):
+        """Parse one comma-separated line of feature values.
+
+        Returns a float64 array ordered like ``self.features``, or None when
+        the line has the wrong number of values or a value is not a finite
+        number.
+        """
+        tokens = line.split(',')
+        if len(tokens) != len(self.features):
+            return None
+        try:
+            x = np.array([float(t) for t in tokens])
+        except ValueError:
+            return None
+        return x if np.isfinite(x).all() else None
+
+    def predict_batch(self, X):
+        """Predict prices for an (n, p) array whose columns follow ``self.features``.
+
+        Large batches go through the numba kernel in ``model_kernel`` when
+        numba is installed.  Raises RuntimeError if the model is not trained
+        and ValueError if ``X`` does not have one column per feature.
+        """
+        if not self.is_trained:
+            raise RuntimeError("model is not trained")
+        X = np.asarray(X, dtype=np.float64)
+        if X.ndim != 2 or X.shape[1] != len(self._coef):
+            raise ValueError(
+                f"expected an (n, {len(self._coef)}) array, got shape {X.shape}")
+        if X.shape[0] < _JIT_MIN_ROWS:
+            return X @ self._coef + self._intercept
+        from model_kernel import score
+        if score is None:
+            return X @ self._coef + self._intercept
+        out = np.empty(X.shape[0])
+        score(np.ascontiguousarray(X), self._coef, float(self._intercept), out)
+        return out
+
     # ------------------------------------------------------------------ #
     #  File handling — data.txt
     # ------------------------------------------------------------------ #
     def save_prediction(self, input_values, predicted_price):
-        """Append a prediction record to data.txt."""
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        features_str = ", ".join(f"{k}={v}" for k, v in input_values.items())
-        line = f"{timestamp} | {features_str} | Predicted: ${predicted_price:,.2f}\n"
-        with open(self.data_file, 'a') as f:
-            f.write(line)
+        """Append a prediction record to data.txt as one JSON line.
+
+        The file is kept open in append mode for the lifetime of the model
+        and flushed before the history is read and at interpreter exit.
+        """
+        timestamp = self._timestamp()
+        if tuple(input_values) == self._save_tpl_key:
+            line = self._save_tpl.format(timestamp, *input_values.values(), predicted_price)
+        else:
+            record = {"ts": timestamp, "features": input_values, "price": predicted_price}
+            line = json.dumps(record) + "\n"
+
+        if self._data_fh is None:
+            self._data_fh = open(self.data_file, 'a', buffering=8192)
+            _open_models.add(self)
+        self._data_fh.write(line)
         print(f"  [✓] Prediction saved to {self.data_file}")
 
-    def load_predictions(self):
-        """Read and display prediction history from data.txt."""
+    def _timestamp(self):
+        """Local time as ``YYYY-MM-DD HH:MM:SS``, reformatted once per second."""
+        sec = int(time.time())
+        if sec != self._ts_sec:
+            lt = time.localtime(sec)
+            self._ts_str = (f"{lt.tm_year:04d}-{lt.tm_mon:02d}-{lt.tm_mday:02d} "
+                            f"{lt.tm_hour:02d}:{lt.tm_min:02d}:{lt.tm_sec:02d}")
+            self._ts_sec = sec
+        return self._ts_str
+
+    def _build_save_template(self):
+        """Precompute the JSON line template used by save_prediction.
+
+        Rebuilt whenever the feature set changes; positional fields are the
+        timestamp, the feature values in order, and the predicted price.
+        """
+        # Escape braces in column names so str.format keeps them literal.
+        fields = ", ".join(
+            json.dumps(f).replace('{', '{{').replace('}', '}}') + ": {}"
+            for f in self.features
+        )
+        self._save_tpl = ('{{"ts": "{}", "features": {{' + fields
+                          + '}}, "price": {}}}\n')
+        self._save_tpl_key = tuple(self.features)
+
+    def _close(self):
+        """Flush and close the data.txt handle opened by save_prediction."""
+        if self._data_fh is not None:
+            self._data_fh.close()
+            self._data_fh = None
+        _open_models.discard(self)
+
+    def load_predictions(self, last=50):
+        """Display the last ``last`` predictions from data.txt (all if None).
+
+        Records are JSON lines; plain-text lines written by older versions
+        are shown as they are.
+        """
         print("\n" + "=" * 60)
         print("           PREDICTION HISTORY")
         print("=" * 60)
+        if self._data_fh is not None:
+            self._data_fh.flush()
         try:
-            with open(self.data_file, 'r') as f:
-                lines = f.readlines()
-            if not lines:
-                print("  No predictions recorded yet.")
+            if last is None:
+                shown = self._print_all_predictions()
             else:
-                for i, line in enumerate(lines, 1):
-                    print(f"  {i}. {line.strip()}")
+                lines, truncated = _tail_lines(self.data_file, last)
+                if truncated:
+                    print(f"  (showing the last {len(lines)} entries; "
+                          "older ones omitted)")
+                sys.stdout.writelines(
+                    f"  {i}. {_format_record(line)}\n" for i, line in enumerate(lines, 1)
+                )
+                shown = len(lines)
+            if shown == 0:
+                print("  No predictions recorded yet.")
         except FileNotFoundError:
             print("  No predictions recorded yet.")
         print("=" * 60)
+
+    def _print_all_predictions(self):
+        """Stream every record in data.txt to stdout; return how many were shown."""
+        buf = []
+        i = 0
+        with open(self.data_file, 'r') as f:
+            for i, line in enumerate(f, 1):
+                buf.append(f"  {i}. {_format_record(line.strip())}\n")
+                if len(buf) >= 1024:
+                    sys.stdout.writelines(buf)
+                    buf.clear()
+        sys.stdout.writelines(buf)
+        return i
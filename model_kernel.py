@@ -0,0 +1,23 @@
+"""Numba-compiled scoring kernel used by HousePriceModel.predict_batch.
+
+numba is optional: when it is not installed ``score`` is None and callers
+fall back to the plain NumPy expression.
+"""
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+
+if njit is not None:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def score(X, coef, intercept, out):
+        """Write ``X @ coef + intercept`` into ``out``, splitting rows across threads."""
+        for i in prange(X.shape[0]):
+            s = intercept
+            for j in range(coef.shape[0]):
+                s += X[i, j] * coef[j]
+            out[i] = s
+else:
+    score = None